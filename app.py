@@ -1,10 +1,17 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit
+import orjson
 from typing import Dict, Optional, Tuple, List
-from dataclasses import dataclass, field
-from enum import IntEnum
+from bisect import bisect_right
+from dataclasses import dataclass, field, fields
+from enum import IntEnum, IntFlag
+import os
+import sqlite3
+import threading
 import time
-from functools import lru_cache
+from string import Template
 
 # ============================================================================
 # CONFIGURATION & CONSTANTS
@@ -15,8 +22,23 @@ class Config:
     APP_ICON = "🏔️"
     API_TIMEOUT = 10
     NOMINATIM_DELAY = 1  # Seconds between API calls
+    OPEN_ELEVATION_DELAY = 1
     USER_AGENT = "AltitudeSicknessAnalyzer/2.0"
-    CACHE_TTL = 3600  # 1 hour cache for API calls
+    CACHE_TTL = 24 * 60 * 60  # Elevations don't change; keep lookups for a day
+    CACHE_MAX_ENTRIES = 1024  # Bound the in-memory lookup cache
+    HTTP_POOL_CONNECTIONS = 10  # One pool per API host
+    HTTP_POOL_MAXSIZE = 20
+    HTTP_RETRIES = 3
+    HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    CACHE_DB_PATH = os.path.join(BASE_DIR, "elevation_cache.db")
+    CSS_PATH = os.path.join(BASE_DIR, "assets", "style.css")
+    CONTENT_DIR = os.path.join(BASE_DIR, "content")
+    COORD_PRECISION = 4  # Decimal places (~11m) for elevation cache keys
+    METERS_TO_FEET = 3.28084
+    DEBUG = os.environ.get("ALTITUDE_DEBUG") == "1"  # Show cache stats in the sidebar
+    MIN_ELEVATION = 0  # Valid elevation range in meters
+    MAX_ELEVATION = 9000
 
 class AltitudeThresholds(IntEnum):
     """Altitude thresholds in meters based on WMS 2024 guidelines"""
@@ -31,6 +53,36 @@ class LakeLouiseThresholds(IntEnum):
     NO_AMS = 2
     MILD_MODERATE = 5
 
+class SymptomFlag(IntFlag):
+    """Symptom bits, named after the matching Symptoms fields"""
+    HEADACHE = 1 << 0
+    NAUSEA = 1 << 1
+    FATIGUE = 1 << 2
+    DIZZINESS = 1 << 3
+    ANOREXIA = 1 << 4
+    DYSPNEA_EXERTION = 1 << 5
+    DYSPNEA_REST = 1 << 6
+    COUGH_DRY = 1 << 7
+    COUGH_PRODUCTIVE = 1 << 8
+    CHEST_TIGHTNESS = 1 << 9
+    ATAXIA = 1 << 10
+    ALTERED_MENTAL = 1 << 11
+    SEVERE_LASSITUDE = 1 << 12
+    CYANOSIS = 1 << 13
+    
+    # Symptom groups
+    BASIC = HEADACHE | NAUSEA | FATIGUE | DIZZINESS | ANOREXIA
+    PULMONARY = DYSPNEA_EXERTION | DYSPNEA_REST | COUGH_DRY | COUGH_PRODUCTIVE | CHEST_TIGHTNESS
+    CEREBRAL = ATAXIA | ALTERED_MENTAL | SEVERE_LASSITUDE | CYANOSIS
+    # Any of these warrants a diagnosis; loss of appetite alone does not
+    DIAGNOSABLE = HEADACHE | NAUSEA | FATIGUE | DIZZINESS | PULMONARY | CEREBRAL
+    # Present on their own, these mean HAPE or HACE
+    EMERGENCY = DYSPNEA_REST | COUGH_PRODUCTIVE | CEREBRAL
+
+def popcount(value: int) -> int:
+    """Count set bits (int.bit_count() needs Python 3.10+)"""
+    return bin(value).count("1")
+
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
@@ -46,9 +98,9 @@ class ElevationData:
     
     def __post_init__(self):
         if self.success and self.elevation is not None:
-            if self.elevation < 0 or self.elevation > 9000:
+            if not Config.MIN_ELEVATION <= self.elevation <= Config.MAX_ELEVATION:
                 self.success = False
-                self.error = "Elevation out of valid range (0-9000m)"
+                self.error = f"Elevation out of valid range ({Config.MIN_ELEVATION}-{Config.MAX_ELEVATION}m)"
 
 @dataclass
 class RiskProfile:
@@ -91,35 +143,36 @@ class Symptoms:
     severe_lassitude: bool = False
     cyanosis: bool = False
     
+    # SymptomFlag bits of all checked symptoms, packed once at construction
+    mask: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.mask = 0
+        for symptom in fields(self):
+            if symptom.init and getattr(self, symptom.name):
+                self.mask |= SymptomFlag[symptom.name.upper()]
+    
     def basic_count(self) -> int:
         """Count basic AMS symptoms"""
-        return sum([
-            self.headache, self.nausea, self.fatigue, 
-            self.dizziness, self.anorexia
-        ])
+        return popcount(self.mask & SymptomFlag.BASIC)
     
     def pulmonary_count(self) -> int:
         """Count pulmonary symptoms"""
-        return sum([
-            self.dyspnea_exertion, self.dyspnea_rest, self.cough_dry,
-            self.cough_productive, self.chest_tightness
-        ])
+        return popcount(self.mask & SymptomFlag.PULMONARY)
     
     def cerebral_count(self) -> int:
         """Count cerebral symptoms"""
-        return sum([
-            self.ataxia, self.altered_mental, 
-            self.severe_lassitude, self.cyanosis
-        ])
+        return popcount(self.mask & SymptomFlag.CEREBRAL)
+    
+    def has_any(self, flags: SymptomFlag) -> bool:
+        """Check whether any of the given symptoms are present"""
+        return bool(self.mask & flags)
     
     def has_emergency(self) -> bool:
         """Check for emergency symptoms"""
-        return (self.cerebral_count() > 0 or 
-                self.pulmonary_count() >= 2 or 
-                self.dyspnea_rest or 
-                self.cough_productive)
+        return self.has_any(SymptomFlag.EMERGENCY) or self.pulmonary_count() >= 2
 
-@dataclass
+@dataclass(frozen=True)
 class AltitudeAnalysis:
     """Results of altitude analysis"""
     category: str
@@ -127,30 +180,208 @@ class AltitudeAnalysis:
     description: str
     oxygen_sat: str
     color: str
-    recommendations: List[str] = field(default_factory=list)
+    recommendations: Tuple[str, ...] = ()
+
+# ============================================================================
+# PERSISTENT CACHE
+# ============================================================================
+class ElevationCache:
+    """SQLite-backed cache of geocoding and elevation lookups
+    
+    Survives app restarts so repeat queries skip the rate-limited public
+    APIs. Any database error is treated as a cache miss.
+    """
+    
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        try:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS geocode "
+                    "(name TEXT PRIMARY KEY, lat REAL, lon REAL, display_name TEXT)"
+                )
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS elevation "
+                    "(lat REAL, lon REAL, elevation REAL, PRIMARY KEY (lat, lon))"
+                )
+        except sqlite3.Error:
+            self._conn = None
+    
+    def _fetch(self, query: str, params: tuple) -> Optional[tuple]:
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                return self._conn.execute(query, params).fetchone()
+        except sqlite3.Error:
+            return None
+    
+    def _store(self, query: str, params: tuple):
+        if self._conn is None:
+            return
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(query, params)
+        except sqlite3.Error:
+            pass
+    
+    def _lookup(self, query: str, params: tuple) -> Optional[tuple]:
+        row = self._fetch(query, params)
+        with self._lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return row
+    
+    def stats(self) -> Dict[str, int]:
+        """Lookup counters for this process and stored row counts"""
+        with self._lock:
+            counts = {"hits": self.hits, "misses": self.misses}
+        for table in ("geocode", "elevation"):
+            row = self._fetch(f"SELECT COUNT(*) FROM {table}", ())
+            counts[f"{table}_rows"] = row[0] if row else 0
+        return counts
+    
+    @staticmethod
+    def _coord_key(lat: float, lon: float) -> Tuple[float, float]:
+        return round(lat, Config.COORD_PRECISION), round(lon, Config.COORD_PRECISION)
+    
+    def get_geocode(self, name: str) -> Optional[Tuple[float, float, str]]:
+        """Return cached (lat, lon, display_name) for a location name"""
+        return self._lookup(
+            "SELECT lat, lon, display_name FROM geocode WHERE name = ?",
+            (name.lower(),)
+        )
+    
+    def set_geocode(self, name: str, lat: float, lon: float, display_name: str):
+        self._store(
+            "INSERT OR REPLACE INTO geocode VALUES (?, ?, ?, ?)",
+            (name.lower(), lat, lon, display_name)
+        )
+    
+    def get_elevation(self, lat: float, lon: float) -> Optional[float]:
+        """Return cached elevation for coordinates, if any"""
+        row = self._lookup(
+            "SELECT elevation FROM elevation WHERE lat = ? AND lon = ?",
+            self._coord_key(lat, lon)
+        )
+        return row[0] if row else None
+    
+    def set_elevation(self, lat: float, lon: float, elevation: float):
+        self._store(
+            "INSERT OR REPLACE INTO elevation VALUES (?, ?, ?)",
+            (*self._coord_key(lat, lon), elevation)
+        )
+
+@st.cache_resource
+def get_elevation_cache() -> ElevationCache:
+    """Process-wide SQLite cache, shared across reruns and sessions"""
+    return ElevationCache(Config.CACHE_DB_PATH)
 
 # ============================================================================
 # API FUNCTIONS WITH CACHING AND RATE LIMITING
 # ============================================================================
-@lru_cache(maxsize=100)
+# Streamlit re-executes this script on every rerun, so anything that must
+# outlive a single run (connection pools, rate-limit state) lives in
+# st.cache_resource rather than in module globals.
+class RateLimiter:
+    """Thread-safe minimum spacing between calls to one API host"""
+    
+    def __init__(self, min_interval: float):
+        self._min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = float("-inf")
+    
+    def wait(self):
+        """Block until this caller's request slot is due"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Pooled keep-alive session shared by all users and reruns"""
+    session = requests.Session()
+    session.headers['User-Agent'] = Config.USER_AGENT
+    adapter = HTTPAdapter(
+        pool_connections=Config.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=Config.HTTP_POOL_MAXSIZE
+    )
+    session.mount("https://", adapter)
+    return session
+
+@st.cache_resource
+def get_rate_limiter(host: str, min_interval: float) -> RateLimiter:
+    """Process-wide rate limiter for one API host"""
+    return RateLimiter(min_interval)
+
+def rate_limited_get(url: str, min_interval: float, **kwargs) -> requests.Response:
+    """GET through the shared session, spaced by the host's rate limiter
+    
+    Responses in HTTP_RETRY_STATUSES are retried up to HTTP_RETRIES times.
+    Every attempt waits on the limiter (plus any Retry-After the server
+    sends), so retries stay within the API's usage policy. Timeouts and
+    connection errors are not retried.
+    """
+    limiter = get_rate_limiter(urlsplit(url).hostname, min_interval)
+    for attempt in range(Config.HTTP_RETRIES + 1):
+        limiter.wait()
+        response = get_http_session().get(url, timeout=Config.API_TIMEOUT, **kwargs)
+        if response.status_code not in Config.HTTP_RETRY_STATUSES or attempt == Config.HTTP_RETRIES:
+            break
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            # Give up rather than hold the spinner through a long back-off
+            if int(retry_after) > Config.API_TIMEOUT:
+                break
+            time.sleep(int(retry_after))
+    response.raise_for_status()
+    return response
+
+class LookupCounters:
+    """Thread-safe named counters for cache statistics"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {}
+    
+    def increment(self, name: str):
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + 1
+    
+    def get(self, name: str) -> int:
+        with self._lock:
+            return self._counts.get(name, 0)
+
+@st.cache_resource
+def get_lookup_counters() -> LookupCounters:
+    """Process-wide lookup counters, shared across reruns and sessions"""
+    return LookupCounters()
+
 def geocode_location(location_name: str) -> Tuple[Optional[float], Optional[float], Optional[str], Optional[str]]:
     """Geocode location with caching
     
     Returns: (lat, lon, display_name, error)
     """
+    cached = get_elevation_cache().get_geocode(location_name)
+    if cached:
+        return (*cached, None)
+    
     try:
-        time.sleep(Config.NOMINATIM_DELAY)
-        
-        geocode_url = (
-            f"https://nominatim.openstreetmap.org/search"
-            f"?q={location_name}&format=json&limit=1&accept-language=en"
+        response = rate_limited_get(
+            "https://nominatim.openstreetmap.org/search",
+            Config.NOMINATIM_DELAY,
+            params={"q": location_name, "format": "json", "limit": 1, "accept-language": "en"}
         )
-        headers = {'User-Agent': Config.USER_AGENT}
-        
-        response = requests.get(geocode_url, headers=headers, timeout=Config.API_TIMEOUT)
-        response.raise_for_status()
         
-        data = response.json()
+        data = orjson.loads(response.content)
         if not data:
             return None, None, None, "Location not found. Try a more specific name."
         
@@ -159,6 +390,7 @@ def geocode_location(location_name: str) -> Tuple[Optional[float], Optional[floa
         lon = float(location_data['lon'])
         display_name = location_data.get('display_name', 'Unknown')
         
+        get_elevation_cache().set_geocode(location_name, lat, lon, display_name)
         return lat, lon, display_name, None
         
     except requests.exceptions.Timeout:
@@ -168,18 +400,20 @@ def geocode_location(location_name: str) -> Tuple[Optional[float], Optional[floa
     except (KeyError, ValueError, TypeError) as e:
         return None, None, None, f"Data parsing error: {str(e)}"
 
-@lru_cache(maxsize=100)
 def get_elevation_from_coords(lat: float, lon: float) -> Tuple[Optional[float], Optional[str]]:
     """Get elevation from coordinates with caching
     
     Returns: (elevation, error)
     """
+    cached = get_elevation_cache().get_elevation(lat, lon)
+    if cached is not None:
+        return cached, None
+    
     try:
         elevation_url = f"https://api.open-elevation.com/api/v1/lookup?locations={lat},{lon}"
-        response = requests.get(elevation_url, timeout=Config.API_TIMEOUT)
-        response.raise_for_status()
+        response = rate_limited_get(elevation_url, Config.OPEN_ELEVATION_DELAY)
         
-        elevation_data = response.json()
+        elevation_data = orjson.loads(response.content)
         if not elevation_data.get('results'):
             return None, "No elevation data available"
         
@@ -187,27 +421,54 @@ def get_elevation_from_coords(lat: float, lon: float) -> Tuple[Optional[float],
         if elevation is None:
             return None, "Elevation data unavailable"
         
-        return float(elevation), None
+        elevation = float(elevation)
+        get_elevation_cache().set_elevation(lat, lon, elevation)
+        return elevation, None
         
     except requests.exceptions.RequestException as e:
         return None, f"Elevation API error: {str(e)}"
     except (KeyError, ValueError, TypeError) as e:
         return None, f"Data parsing error: {str(e)}"
 
-def get_elevation(location_name: str) -> ElevationData:
-    """Main function to get elevation for a location"""
-    if not location_name or not location_name.strip():
-        return ElevationData(success=False, error="Location name cannot be empty")
+class ElevationLookupError(Exception):
+    """Failed lookup, raised so st.cache_data does not store the failure"""
+
+@st.cache_data(ttl=Config.CACHE_TTL, max_entries=Config.CACHE_MAX_ENTRIES, show_spinner=False)
+def _fetch_elevation(query: str) -> Tuple[float, str, float, float]:
+    """Geocode and look up elevation for a normalized query
+    
+    Returns: (elevation, display_name, lat, lon)
+    """
+    # Only runs on an st.cache_data miss
+    get_lookup_counters().increment("fetches")
     
     # Geocode
-    lat, lon, display_name, error = geocode_location(location_name.strip())
+    lat, lon, display_name, error = geocode_location(query)
     if error:
-        return ElevationData(success=False, error=error)
+        raise ElevationLookupError(error)
     
-    # Get elevation
-    elevation, error = get_elevation_from_coords(lat, lon)
+    # Get elevation, rounding so nearby points share cache entries
+    elevation, error = get_elevation_from_coords(
+        round(lat, Config.COORD_PRECISION),
+        round(lon, Config.COORD_PRECISION)
+    )
     if error:
-        return ElevationData(success=False, error=error)
+        raise ElevationLookupError(error)
+    
+    return elevation, display_name, lat, lon
+
+def get_elevation(location_name: str) -> ElevationData:
+    """Main function to get elevation for a location"""
+    if not location_name or not location_name.strip():
+        return ElevationData(success=False, error="Location name cannot be empty")
+    
+    # Normalized so "Mount  Everest " and "mount everest" share a cache entry
+    query = " ".join(location_name.split()).lower()
+    get_lookup_counters().increment("lookups")
+    try:
+        elevation, display_name, lat, lon = _fetch_elevation(query)
+    except ElevationLookupError as e:
+        return ElevationData(success=False, error=str(e))
     
     return ElevationData(
         success=True,
@@ -217,135 +478,156 @@ def get_elevation(location_name: str) -> ElevationData:
         lon=lon
     )
 
+def cache_stats() -> Dict[str, int]:
+    """Hit/miss counts for the in-memory and SQLite lookup caches
+    
+    _fetch_elevation's body only runs on an st.cache_data miss, so lookups
+    that never reached it were served from memory.
+    """
+    counters = get_lookup_counters()
+    lookups, fetches = counters.get("lookups"), counters.get("fetches")
+    stats = {"memory_hits": lookups - fetches, "memory_misses": fetches}
+    for name, value in get_elevation_cache().stats().items():
+        stats[f"sqlite_{name}"] = value
+    return stats
+
 # ============================================================================
 # ANALYSIS FUNCTIONS
 # ============================================================================
-def analyze_altitude(elevation: float) -> AltitudeAnalysis:
-    """Categorize altitude and provide physiological information"""
-    if elevation < AltitudeThresholds.SEA_LEVEL:
-        return AltitudeAnalysis(
-            category='Sea Level to Low Altitude',
-            risk='Minimal',
-            description='No altitude-related physiological changes expected.',
-            oxygen_sat='>95%',
-            color='low',
-            recommendations=['Normal activity can be maintained']
-        )
-    elif elevation < AltitudeThresholds.INTERMEDIATE:
-        return AltitudeAnalysis(
-            category='Intermediate Altitude (1,500-2,500m)',
-            risk='Low',
-            description='Physiological changes detectable. Arterial oxygen saturation >90%.',
-            oxygen_sat='>90%',
-            color='low',
-            recommendations=[
-                'Monitor for mild symptoms',
-                'Stay well hydrated',
-                'Gradual ascent recommended'
-            ]
+# Altitude categories in ascending order. ALTITUDE_CATEGORIES[i] applies
+# below _CATEGORY_UPPER_BOUNDS[i]; the last category has no upper bound.
+_CATEGORY_UPPER_BOUNDS = (
+    AltitudeThresholds.SEA_LEVEL,
+    AltitudeThresholds.INTERMEDIATE,
+    AltitudeThresholds.HIGH,
+    AltitudeThresholds.VERY_HIGH,
+    AltitudeThresholds.EXTREME,
+)
+
+ALTITUDE_CATEGORIES = (
+    AltitudeAnalysis(
+        category='Sea Level to Low Altitude',
+        risk='Minimal',
+        description='No altitude-related physiological changes expected.',
+        oxygen_sat='>95%',
+        color='low',
+        recommendations=('Normal activity can be maintained',)
+    ),
+    AltitudeAnalysis(
+        category='Intermediate Altitude (1,500-2,500m)',
+        risk='Low',
+        description='Physiological changes detectable. Arterial oxygen saturation >90%.',
+        oxygen_sat='>90%',
+        color='low',
+        recommendations=(
+            'Monitor for mild symptoms',
+            'Stay well hydrated',
+            'Gradual ascent recommended'
         )
-    elif elevation < AltitudeThresholds.HIGH:
-        return AltitudeAnalysis(
-            category='High Altitude (2,500-3,500m)',
-            risk='Moderate',
-            description='Altitude illness common with rapid ascent.',
-            oxygen_sat='85-90%',
-            color='medium',
-            recommendations=[
-                'Ascend gradually (300-500m/day above 3000m)',
-                'Include rest days for acclimatization',
-                'Consider prophylactic medication if rapid ascent necessary'
-            ]
+    ),
+    AltitudeAnalysis(
+        category='High Altitude (2,500-3,500m)',
+        risk='Moderate',
+        description='Altitude illness common with rapid ascent.',
+        oxygen_sat='85-90%',
+        color='medium',
+        recommendations=(
+            'Ascend gradually (300-500m/day above 3000m)',
+            'Include rest days for acclimatization',
+            'Consider prophylactic medication if rapid ascent necessary'
         )
-    elif elevation < AltitudeThresholds.VERY_HIGH:
-        return AltitudeAnalysis(
-            category='Very High Altitude (3,500-5,800m)',
-            risk='High',
-            description='Altitude illness common. Marked hypoxemia during exercise.',
-            oxygen_sat='<90%',
-            color='high',
-            recommendations=[
-                'Mandatory acclimatization required',
-                'Ascend 300-500m per day maximum',
-                'Include rest day every 3-4 days',
-                'Strong consideration for prophylactic medication'
-            ]
+    ),
+    AltitudeAnalysis(
+        category='Very High Altitude (3,500-5,800m)',
+        risk='High',
+        description='Altitude illness common. Marked hypoxemia during exercise.',
+        oxygen_sat='<90%',
+        color='high',
+        recommendations=(
+            'Mandatory acclimatization required',
+            'Ascend 300-500m per day maximum',
+            'Include rest day every 3-4 days',
+            'Strong consideration for prophylactic medication'
         )
-    elif elevation < AltitudeThresholds.EXTREME:
-        return AltitudeAnalysis(
-            category='Extreme Altitude (5,800-8,000m)',
-            risk='Very High',
-            description='Marked hypoxemia at rest. Progressive deterioration inevitable.',
-            oxygen_sat='<80%',
-            color='high',
-            recommendations=[
-                'Expert mountaineering experience required',
-                'Prophylactic medication strongly recommended',
-                'Supplemental oxygen may be necessary',
-                'Minimize time at altitude'
-            ]
+    ),
+    AltitudeAnalysis(
+        category='Extreme Altitude (5,800-8,000m)',
+        risk='Very High',
+        description='Marked hypoxemia at rest. Progressive deterioration inevitable.',
+        oxygen_sat='<80%',
+        color='high',
+        recommendations=(
+            'Expert mountaineering experience required',
+            'Prophylactic medication strongly recommended',
+            'Supplemental oxygen may be necessary',
+            'Minimize time at altitude'
         )
-    else:
-        return AltitudeAnalysis(
-            category='Death Zone (>8,000m)',
-            risk='Extreme',
-            description='Most mountaineers require supplementary oxygen.',
-            oxygen_sat='~55%',
-            color='high',
-            recommendations=[
-                'Supplemental oxygen required for most individuals',
-                'Expert medical and mountaineering support essential',
-                'Minimize exposure time'
-            ]
+    ),
+    AltitudeAnalysis(
+        category='Death Zone (>8,000m)',
+        risk='Extreme',
+        description='Most mountaineers require supplementary oxygen.',
+        oxygen_sat='~55%',
+        color='high',
+        recommendations=(
+            'Supplemental oxygen required for most individuals',
+            'Expert medical and mountaineering support essential',
+            'Minimize exposure time'
         )
+    ),
+)
+
+def analyze_altitude(elevation: float) -> AltitudeAnalysis:
+    """Categorize altitude and provide physiological information
+    
+    Returns a shared, immutable AltitudeAnalysis for the matching category.
+    """
+    return ALTITUDE_CATEGORIES[bisect_right(_CATEGORY_UPPER_BOUNDS, elevation)]
+
+# Risk rules in report order: (predicate(elevation, profile), level, factor).
+# The overall level is the highest level among the matching rules.
+RISK_RULES = (
+    (lambda elevation, profile: profile.previous_hace,
+     "High", "Previous HACE - high recurrence risk"),
+    (lambda elevation, profile: profile.previous_hape,
+     "High", "Previous HAPE - high recurrence risk"),
+    (lambda elevation, profile: (profile.previous_ams and not profile.has_severe_history()
+                                 and elevation >= AltitudeThresholds.HIGH),
+     "High", "Previous AMS with ascent to very high altitude"),
+    (lambda elevation, profile: (profile.previous_ams and not profile.has_severe_history()
+                                 and elevation < AltitudeThresholds.HIGH),
+     "Moderate", "Previous AMS history"),
+    (lambda elevation, profile: (elevation >= AltitudeThresholds.HIGH and
+                                 (profile.rapid_ascent or profile.no_acclimatization)),
+     "High", "Rapid ascent to very high altitude without acclimatization"),
+    # Only reported when nothing else has raised the risk level
+    (lambda elevation, profile: (2800 <= elevation < AltitudeThresholds.HIGH and
+                                 profile.rapid_ascent and not profile.has_any_history()),
+     "Moderate", "Rapid ascent to high altitude"),
+    # Modifier only: listed as a factor without raising the level
+    (lambda elevation, profile: (profile.physical_activity and
+                                 elevation >= AltitudeThresholds.INTERMEDIATE),
+     "Low", "Strenuous activity planned - increases risk"),
+)
+
+_RISK_LEVEL_RANK = {"Low": 0, "Moderate": 1, "High": 2}
 
 def assess_risk_profile(elevation: float, profile: RiskProfile) -> Tuple[str, List[str]]:
     """Assess risk based on WMS 2024 criteria"""
-    risk_level = "Low"
-    risk_factors = []
-    
-    # Severe history automatically means high risk
-    if profile.has_severe_history():
-        risk_level = "High"
-        if profile.previous_hace:
-            risk_factors.append("Previous HACE - high recurrence risk")
-        if profile.previous_hape:
-            risk_factors.append("Previous HAPE - high recurrence risk")
-    
-    # Previous AMS with current conditions
-    elif profile.previous_ams:
-        if elevation >= AltitudeThresholds.HIGH:
-            risk_level = "High"
-            risk_factors.append("Previous AMS with ascent to very high altitude")
-        else:
-            risk_level = "Moderate"
-            risk_factors.append("Previous AMS history")
-    
-    # Ascent profile assessment
-    if elevation >= AltitudeThresholds.HIGH:
-        if profile.rapid_ascent or profile.no_acclimatization:
-            if risk_level != "High":
-                risk_level = "High"
-            risk_factors.append("Rapid ascent to very high altitude without acclimatization")
-    elif elevation >= 2800:
-        if profile.rapid_ascent and risk_level == "Low":
-            risk_level = "Moderate"
-            risk_factors.append("Rapid ascent to high altitude")
-    
-    # Physical activity modifier
-    if profile.physical_activity and elevation >= AltitudeThresholds.INTERMEDIATE:
-        risk_factors.append("Strenuous activity planned - increases risk")
-    
-    return risk_level, risk_factors
+    matched = [(level, factor) for matches, level, factor in RISK_RULES
+               if matches(elevation, profile)]
+    risk_level = max((level for level, _ in matched),
+                     key=_RISK_LEVEL_RANK.__getitem__, default="Low")
+    return risk_level, [factor for _, factor in matched]
+
+_LAKE_LOUISE_ITEMS = SymptomFlag.HEADACHE | SymptomFlag.FATIGUE | SymptomFlag.DIZZINESS
+_LAKE_LOUISE_GI = SymptomFlag.NAUSEA | SymptomFlag.ANOREXIA
 
 def calculate_lake_louise_score(symptoms: Symptoms) -> Tuple[int, str]:
     """Calculate Lake Louise AMS Score"""
-    score = sum([
-        symptoms.headache,
-        symptoms.nausea or symptoms.anorexia,
-        symptoms.fatigue,
-        symptoms.dizziness
-    ])
+    # Nausea and anorexia share the gastrointestinal item, scored once
+    score = (popcount(symptoms.mask & _LAKE_LOUISE_ITEMS) +
+             bool(symptoms.mask & _LAKE_LOUISE_GI))
     
     if score <= LakeLouiseThresholds.NO_AMS:
         return score, "No AMS"
@@ -357,64 +639,80 @@ def calculate_lake_louise_score(symptoms: Symptoms) -> Tuple[int, str]:
 # ============================================================================
 # UI STYLING
 # ============================================================================
+@st.cache_resource
+def load_text_file(path: str) -> str:
+    """Read a static asset once per server process"""
+    with open(path, encoding="utf-8") as text_file:
+        return text_file.read()
+
+def load_markdown(name: str) -> str:
+    """Load a guidance document from the content directory"""
+    return load_text_file(os.path.join(Config.CONTENT_DIR, f"{name}.md"))
+
 def apply_custom_css():
     """Apply custom CSS styling"""
-    st.markdown("""
-        <style>
-        .main-header {
-            font-size: 2.5rem;
-            color: #1f77b4;
-            text-align: center;
-            margin-bottom: 1rem;
-        }
-        .subtitle {
-            text-align: center;
-            color: #666;
-            margin-bottom: 2rem;
-        }
-        .risk-high {
-            background-color: #ffcccc;
-            padding: 1.5rem;
-            border-radius: 0.5rem;
-            border-left: 5px solid #ff0000;
-            margin: 1rem 0;
-        }
-        .risk-medium {
-            background-color: #fff4cc;
-            padding: 1.5rem;
-            border-radius: 0.5rem;
-            border-left: 5px solid #ffaa00;
-            margin: 1rem 0;
-        }
-        .risk-low {
-            background-color: #ccffcc;
-            padding: 1.5rem;
-            border-radius: 0.5rem;
-            border-left: 5px solid #00aa00;
-            margin: 1rem 0;
-        }
-        .guideline-box {
-            background-color: #e8f4f8;
-            padding: 1.5rem;
-            border-radius: 0.5rem;
-            border-left: 5px solid #1f77b4;
-            margin: 1rem 0;
-        }
-        .emergency-box {
-            background-color: #ffe6e6;
-            padding: 1.5rem;
-            border-radius: 0.5rem;
-            border: 2px solid #ff0000;
-            margin: 1rem 0;
-        }
-        .metric-container {
-            background-color: #f8f9fa;
-            padding: 1rem;
-            border-radius: 0.5rem;
-            text-align: center;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    st.markdown(f"<style>{load_text_file(Config.CSS_PATH)}</style>", unsafe_allow_html=True)
+
+# ============================================================================
+# STATIC CONTENT
+# ============================================================================
+HEADER_HTML = f'<h1 class="main-header">{Config.APP_ICON} {Config.APP_TITLE}</h1>'
+SUBTITLE_HTML = '<p class="subtitle">Based on 2024 Wilderness Medical Society Clinical Practice Guidelines</p>'
+
+FOOTER_HTML = """
+<div style='text-align: center; color: #666; padding: 2rem 1rem 1rem 1rem;'>
+    <p style='font-size: 1.1em; margin-bottom: 1rem;'>
+        <strong>⚠️ EMERGENCY PROTOCOL:</strong> If experiencing severe symptoms,
+        <strong style='color: #ff0000;'>DESCEND IMMEDIATELY</strong> and seek medical attention.
+    </p>
+    <p style='margin-bottom: 0.5rem;'>
+        <strong>Evidence Base:</strong> Wilderness Medical Society 2024 Clinical Practice Guidelines
+    </p>
+    <p style='font-size: 0.9em; color: #999;'>
+        This tool is for educational purposes only and does not replace professional medical advice.
+    </p>
+    <p style='font-size: 0.9em; color: #999; margin-top: 1rem;'>
+        Data sources: OpenStreetMap Nominatim API | Open-Elevation API
+    </p>
+</div>
+"""
+
+RISK_CARD_TEMPLATE = Template("""
+<div class="risk-$color">
+    <h3>$category</h3>
+    <p><strong>Risk Level:</strong> $risk</p>
+    <p><strong>Expected Oxygen Saturation:</strong> $oxygen_sat</p>
+    <p>$description</p>
+</div>
+""")
+
+# Prevention expanders in display order: (title, guidance document)
+PREVENTION_SECTIONS = (
+    ("Prophylactic Medications", "prophylaxis"),
+    ("Acclimatization Guidelines", "acclimatization"),
+)
+
+# Emergency diagnoses, checked in order: (predicate, title, guidance document)
+EMERGENCY_RULES = (
+    (
+        lambda symptoms: symptoms.has_any(SymptomFlag.CEREBRAL),
+        "🚨 **EMERGENCY: High Altitude Cerebral Edema (HACE) SUSPECTED**",
+        "hace_treatment"
+    ),
+    (
+        lambda symptoms: (symptoms.has_any(SymptomFlag.DYSPNEA_REST | SymptomFlag.COUGH_PRODUCTIVE) or
+                          symptoms.pulmonary_count() >= 2),
+        "🚨 **EMERGENCY: High Altitude Pulmonary Edema (HAPE) SUSPECTED**",
+        "hape_treatment"
+    ),
+)
+
+# AMS treatment tiers, highest first:
+# (min Lake Louise score, alert, title, guidance document)
+AMS_TREATMENT_TIERS = (
+    (6, st.warning, "⚠️ **SEVERE Acute Mountain Sickness (AMS)**", "severe_ams_treatment"),
+    (3, st.info, "ℹ️ **MILD-MODERATE Acute Mountain Sickness (AMS)**", "mild_ams_treatment"),
+)
 
 # ============================================================================
 # UI COMPONENTS
@@ -428,48 +726,53 @@ def render_elevation_metrics(elevation_data: ElevationData):
     with col2:
         st.metric("⛰️ Elevation", f"{elevation_data.elevation:,.0f} m")
     with col3:
-        st.metric("🗻 Elevation", f"{elevation_data.elevation * 3.28084:,.0f} ft")
+        st.metric("🗻 Elevation", f"{elevation_data.elevation * Config.METERS_TO_FEET:,.0f} ft")
 
 def render_altitude_analysis(analysis: AltitudeAnalysis):
     """Render altitude category analysis"""
     st.header("🎯 Altitude Category & Physiological Effects")
     
-    risk_class = f"risk-{analysis.color}"
-    st.markdown(f"""
-        <div class="{risk_class}">
-            <h3>{analysis.category}</h3>
-            <p><strong>Risk Level:</strong> {analysis.risk}</p>
-            <p><strong>Expected Oxygen Saturation:</strong> {analysis.oxygen_sat}</p>
-            <p>{analysis.description}</p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(RISK_CARD_TEMPLATE.substitute(
+        color=analysis.color,
+        category=analysis.category,
+        risk=analysis.risk,
+        oxygen_sat=analysis.oxygen_sat,
+        description=analysis.description
+    ), unsafe_allow_html=True)
     
     if analysis.recommendations:
         with st.expander("📋 General Recommendations", expanded=True):
-            for rec in analysis.recommendations:
-                st.write(f"• {rec}")
+            st.markdown("\n".join(f"- {rec}" for rec in analysis.recommendations))
 
 def render_risk_profile_form(elevation: float) -> Optional[RiskProfile]:
-    """Render risk profile assessment form"""
+    """Render risk profile assessment form
+    
+    Checkbox values only update when the form is submitted, so the
+    returned profile reflects the last submission.
+    """
     if elevation < AltitudeThresholds.INTERMEDIATE:
         return None
     
     st.header("📊 Personal Risk Assessment")
     st.markdown("*Based on WMS 2024 Clinical Practice Guidelines*")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("Medical History")
-        previous_ams = st.checkbox("Previous acute mountain sickness (AMS)")
-        previous_hace = st.checkbox("Previous high altitude cerebral edema (HACE)")
-        previous_hape = st.checkbox("Previous high altitude pulmonary edema (HAPE)")
-    
-    with col2:
-        st.subheader("Ascent Profile")
-        rapid_ascent = st.checkbox("Rapid ascent (>500m/day above 3000m)")
-        no_acclimatization = st.checkbox("No intermediate acclimatization")
-        physical_activity = st.checkbox("Immediate strenuous activity planned")
+    # Batch the checkboxes so toggling them doesn't rerun the whole app
+    with st.form("risk_profile_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.subheader("Medical History")
+            previous_ams = st.checkbox("Previous acute mountain sickness (AMS)")
+            previous_hace = st.checkbox("Previous high altitude cerebral edema (HACE)")
+            previous_hape = st.checkbox("Previous high altitude pulmonary edema (HAPE)")
+        
+        with col2:
+            st.subheader("Ascent Profile")
+            rapid_ascent = st.checkbox("Rapid ascent (>500m/day above 3000m)")
+            no_acclimatization = st.checkbox("No intermediate acclimatization")
+            physical_activity = st.checkbox("Immediate strenuous activity planned")
+        
+        st.form_submit_button("📊 Assess Risk")
     
     return RiskProfile(
         previous_ams=previous_ams,
@@ -481,37 +784,45 @@ def render_risk_profile_form(elevation: float) -> Optional[RiskProfile]:
     )
 
 def render_symptoms_form() -> Symptoms:
-    """Render symptoms checker form"""
+    """Render symptoms checker form
+    
+    Checkbox values only update when the form is submitted, so the
+    returned symptoms reflect the last submission.
+    """
     st.header("🩺 Symptoms Checker")
     st.markdown("*Check any symptoms currently experienced*")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("Common Symptoms")
-        headache = st.checkbox("Headache")
-        nausea = st.checkbox("Nausea or vomiting")
-        fatigue = st.checkbox("Fatigue or weakness")
-        dizziness = st.checkbox("Dizziness or lightheadedness")
-        anorexia = st.checkbox("Loss of appetite")
-    
-    with col2:
-        st.subheader("Respiratory Symptoms")
-        dyspnea_exertion = st.checkbox("Shortness of breath with exertion")
-        dyspnea_rest = st.checkbox("Shortness of breath at rest")
-        cough_dry = st.checkbox("Dry cough")
-        cough_productive = st.checkbox("Cough with pink/frothy sputum")
-        chest_tightness = st.checkbox("Chest tightness or gurgling")
-    
-    st.markdown("**🚨 Severe Warning Signs (Medical Emergency):**")
-    col3, col4 = st.columns(2)
-    
-    with col3:
-        ataxia = st.checkbox("Loss of coordination/balance")
-        altered_mental = st.checkbox("Confusion or altered consciousness")
-    with col4:
-        severe_lassitude = st.checkbox("Severe weakness/inability to self-care")
-        cyanosis = st.checkbox("Blue lips or fingertips")
+    # Batch the checkboxes so toggling them doesn't rerun the whole app
+    with st.form("symptoms_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.subheader("Common Symptoms")
+            headache = st.checkbox("Headache")
+            nausea = st.checkbox("Nausea or vomiting")
+            fatigue = st.checkbox("Fatigue or weakness")
+            dizziness = st.checkbox("Dizziness or lightheadedness")
+            anorexia = st.checkbox("Loss of appetite")
+        
+        with col2:
+            st.subheader("Respiratory Symptoms")
+            dyspnea_exertion = st.checkbox("Shortness of breath with exertion")
+            dyspnea_rest = st.checkbox("Shortness of breath at rest")
+            cough_dry = st.checkbox("Dry cough")
+            cough_productive = st.checkbox("Cough with pink/frothy sputum")
+            chest_tightness = st.checkbox("Chest tightness or gurgling")
+        
+        st.markdown("**🚨 Severe Warning Signs (Medical Emergency):**")
+        col3, col4 = st.columns(2)
+        
+        with col3:
+            ataxia = st.checkbox("Loss of coordination/balance")
+            altered_mental = st.checkbox("Confusion or altered consciousness")
+        with col4:
+            severe_lassitude = st.checkbox("Severe weakness/inability to self-care")
+            cyanosis = st.checkbox("Blue lips or fingertips")
+        
+        st.form_submit_button("🩺 Check Symptoms")
     
     return Symptoms(
         headache=headache, nausea=nausea, fatigue=fatigue,
@@ -528,63 +839,24 @@ def render_diagnosis(symptoms: Symptoms):
     st.markdown("---")
     
     # Emergency conditions
-    if symptoms.cerebral_count() > 0:
-        st.markdown('<div class="emergency-box">', unsafe_allow_html=True)
-        st.error("🚨 **EMERGENCY: High Altitude Cerebral Edema (HACE) SUSPECTED**")
-        st.error("""
-        **Immediate Actions Required:**
-        - **DESCEND IMMEDIATELY** 300-1,000m (do not descend alone)
-        - Administer **Dexamethasone 8mg** immediately, then 4mg every 6 hours
-        - **Supplemental oxygen** 2-4 L/min if available (target SpO₂ >90%)
-        - Consider portable hyperbaric chamber if descent delayed
-        - **EVACUATE TO MEDICAL FACILITY**
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    if symptoms.pulmonary_count() >= 2 or symptoms.dyspnea_rest or symptoms.cough_productive:
-        st.markdown('<div class="emergency-box">', unsafe_allow_html=True)
-        st.error("🚨 **EMERGENCY: High Altitude Pulmonary Edema (HAPE) SUSPECTED**")
-        st.error("""
-        **Immediate Actions Required:**
-        - **DESCEND IMMEDIATELY** (minimize exertion, use assistance)
-        - **Supplemental oxygen** to achieve SpO₂ >90%
-        - **Nifedipine** 30mg extended release every 12 hours (if oxygen unavailable)
-        - Rest, keep warm, minimize physical activity
-        - **EVACUATE TO MEDICAL FACILITY**
-        - If concurrent HACE suspected, add Dexamethasone
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
+    for matches, title, guidance in EMERGENCY_RULES:
+        if matches(symptoms):
+            st.markdown('<div class="emergency-box">', unsafe_allow_html=True)
+            st.error(title)
+            st.error(load_markdown(guidance))
+            st.markdown('</div>', unsafe_allow_html=True)
     
     # AMS diagnosis
-    if symptoms.headache and symptoms.basic_count() >= 1 and not symptoms.has_emergency():
+    if symptoms.headache and not symptoms.has_emergency():
         lake_louise_score, severity = calculate_lake_louise_score(symptoms)
         
         st.info(f"📊 Lake Louise Score: **{lake_louise_score}/12** - {severity}")
         
-        if lake_louise_score >= 6:
-            st.warning("⚠️ **SEVERE Acute Mountain Sickness (AMS)**")
-            st.warning("""
-            **Treatment Recommendations (WMS 2024):**
-            - **STOP ASCENT** immediately
-            - **Consider descent** if symptoms don't improve within 24 hours
-            - **Dexamethasone**: 4mg every 6 hours (primary treatment)
-            - **Acetazolamide**: 250mg every 12 hours (adjunct therapy)
-            - Rest and maintain hydration
-            - Supplemental oxygen if available (target SpO₂ >90%)
-            - Ibuprofen 600mg every 8 hours for headache
-            """)
-        elif lake_louise_score >= 3:
-            st.info("ℹ️ **MILD-MODERATE Acute Mountain Sickness (AMS)**")
-            st.info("""
-            **Treatment Recommendations (WMS 2024):**
-            - **STOP ASCENT** until symptoms resolve
-            - Rest at current altitude for 1-3 days
-            - **Ibuprofen** 600mg every 8 hours for headache
-            - **Acetazolamide** 250mg every 12 hours (may be considered)
-            - **Dexamethasone** 4mg every 6 hours for moderate-severe symptoms
-            - Ensure adequate hydration
-            - Descend if symptoms worsen or don't improve in 1-3 days
-            """)
+        for min_score, alert, title, guidance in AMS_TREATMENT_TIERS:
+            if lake_louise_score >= min_score:
+                alert(title)
+                alert(load_markdown(guidance))
+                break
 
 def render_prevention_guidance(elevation: float):
     """Render prevention and prophylaxis guidance"""
@@ -594,61 +866,13 @@ def render_prevention_guidance(elevation: float):
     st.markdown("---")
     st.header("💊 Prevention & Prophylaxis")
     
-    with st.expander("Prophylactic Medications", expanded=False):
-        st.markdown("""
-        **Acetazolamide (Diamox)** - First-line prophylaxis
-        - Dose: 125mg twice daily, starting 1 day before ascent
-        - Continue for 2 days at maximum altitude or until descent
-        - Reduces AMS incidence by ~50%
-        - Side effects: Tingling, altered taste, polyuria
-        
-        **Dexamethasone** - For those intolerant to acetazolamide
-        - Dose: 2mg every 6 hours or 4mg every 12 hours
-        - Start on day of ascent
-        - Does not aid acclimatization, only masks symptoms
-        
-        **Nifedipine** - HAPE prophylaxis for susceptible individuals
-        - Dose: 30mg extended release every 12 hours
-        - Start on day of ascent
-        """)
-    
-    with st.expander("Acclimatization Guidelines", expanded=False):
-        st.markdown("""
-        **Key Principles:**
-        - "Climb high, sleep low" when possible
-        - Above 3,000m: ascend no more than 300-500m per day (sleeping altitude)
-        - Include a rest day every 3-4 days
-        - Stay well hydrated (3-4 liters/day at altitude)
-        - Avoid alcohol and sedatives
-        - Light physical activity okay; avoid overexertion in first 24-48 hours
-        
-        **Gradual Ascent Schedule Example:**
-        - Day 1: 3,000m
-        - Day 2: 3,400m
-        - Day 3: 3,400m (rest/acclimatization day)
-        - Day 4: 3,800m
-        - Day 5: 4,200m
-        - Day 6: 4,200m (rest/acclimatization day)
-        """)
+    for title, document in PREVENTION_SECTIONS:
+        with st.expander(title, expanded=False):
+            st.markdown(load_markdown(document))
 
 def render_welcome_screen():
     """Render welcome screen when no location is selected"""
-    st.info("""
-    👋 **Welcome to the Altitude Sickness Risk Analyzer!**
-    
-    This tool provides evidence-based guidance based on the **2024 Wilderness Medical Society Clinical Practice Guidelines** for the prevention and treatment of acute altitude illness.
-    
-    **Features:**
-    - Real-time elevation data for any location worldwide
-    - Personalized risk assessment based on your medical history
-    - Symptom checker with Lake Louise scoring
-    - Evidence-based treatment recommendations
-    - Prevention and prophylaxis guidance
-    
-    **Get started by entering a location in the sidebar** or manually entering an elevation.
-    
-    ⚠️ **Disclaimer:** This tool is for educational purposes only and does not replace professional medical advice. In case of emergency, descend immediately and seek medical attention.
-    """)
+    st.info(load_markdown("welcome"))
 
 # ============================================================================
 # MAIN APPLICATION
@@ -666,10 +890,8 @@ def main():
     apply_custom_css()
     
     # Header
-    st.markdown(f'<h1 class="main-header">{Config.APP_ICON} {Config.APP_TITLE}</h1>', 
-                unsafe_allow_html=True)
-    st.markdown('<p class="subtitle">Based on 2024 Wilderness Medical Society Clinical Practice Guidelines</p>', 
-                unsafe_allow_html=True)
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
+    st.markdown(SUBTITLE_HTML, unsafe_allow_html=True)
     
     # Sidebar - Location Input
     st.sidebar.header("📍 Location Information")
@@ -686,11 +908,11 @@ def main():
     with col_clear:
         clear_clicked = st.button("🔄 Clear", use_container_width=True)
     
-    # Handle clear button
+    # Handle clear button. The main content below reads session state later
+    # in this same run, so no extra st.rerun() is needed.
     if clear_clicked:
         for key in ['elevation_data', 'analysis_complete']:
             st.session_state.pop(key, None)
-        st.rerun()
     
     # Handle search button
     if search_clicked and location_name:
@@ -708,11 +930,11 @@ def main():
     st.sidebar.markdown("**Or enter elevation manually:**")
     manual_elevation = st.sidebar.number_input(
         "Elevation (meters)",
-        min_value=0,
-        max_value=9000,
+        min_value=Config.MIN_ELEVATION,
+        max_value=Config.MAX_ELEVATION,
         value=0,
         step=100,
-        help="Enter elevation in meters (0-9000m)"
+        help=f"Enter elevation in meters ({Config.MIN_ELEVATION}-{Config.MAX_ELEVATION}m)"
     )
     
     if st.sidebar.button("📊 Use Manual Elevation", use_container_width=True):
@@ -728,6 +950,10 @@ def main():
         else:
             st.warning("Please enter an elevation greater than 0")
     
+    if Config.DEBUG:
+        with st.sidebar.expander("🛠️ Cache Stats"):
+            st.json(cache_stats())
+    
     # Main content area
     if 'elevation_data' in st.session_state and st.session_state['elevation_data'].success:
         elevation_data = st.session_state['elevation_data']
@@ -767,9 +993,7 @@ def main():
         symptoms = render_symptoms_form()
         
         # Diagnosis and treatment
-        if any([symptoms.headache, symptoms.nausea, symptoms.fatigue, 
-                symptoms.dizziness, symptoms.pulmonary_count() > 0,
-                symptoms.cerebral_count() > 0]):
+        if symptoms.has_any(SymptomFlag.DIAGNOSABLE):
             render_diagnosis(symptoms)
         
         # Prevention guidance
@@ -783,53 +1007,15 @@ def main():
         
         with col1:
             with st.expander("🏥 When to Seek Medical Help"):
-                st.markdown("""
-                **Seek immediate medical attention if:**
-                - Symptoms of HACE (ataxia, altered mental status, severe lassitude)
-                - Symptoms of HAPE (rest dyspnea, cough with frothy sputum, severe chest tightness)
-                - Severe AMS not improving with treatment
-                - Any symptoms worsening despite stopping ascent
-                - Inability to eat, drink, or care for oneself
-                
-                **Emergency descent indications:**
-                - Any signs of HACE or HAPE
-                - Severe AMS not responding to treatment within 24 hours
-                - Worsening symptoms at current altitude
-                """)
+                st.markdown(load_markdown("seek_medical_help"))
         
         with col2:
             with st.expander("🎒 Recommended Supplies"):
-                st.markdown("""
-                **Medical Kit for High Altitude:**
-                - Acetazolamide (Diamox) 125mg tablets
-                - Dexamethasone 4mg tablets
-                - Ibuprofen or acetaminophen for headache
-                - Pulse oximeter (to monitor oxygen saturation)
-                - Thermometer
-                - First aid supplies
-                
-                **For High-Risk Individuals:**
-                - Nifedipine 30mg extended release
-                - Portable hyperbaric chamber (Gamow bag)
-                - Supplemental oxygen if possible
-                """)
+                st.markdown(load_markdown("recommended_supplies"))
         
         # High-altitude destinations reference
         with st.expander("🗺️ Common High-Altitude Destinations", expanded=False):
-            st.markdown("""
-            | Destination | Elevation | Category |
-            |------------|-----------|----------|
-            | Cusco, Peru | 3,400m | High Altitude |
-            | La Paz, Bolivia | 3,640m | Very High Altitude |
-            | Lhasa, Tibet | 3,650m | Very High Altitude |
-            | Machu Picchu, Peru | 2,430m | High Altitude |
-            | Kilimanjaro Summit, Tanzania | 5,895m | Extreme Altitude |
-            | Everest Base Camp, Nepal | 5,364m | Extreme Altitude |
-            | Aconcagua Summit, Argentina | 6,961m | Extreme Altitude |
-            | Mount Everest Summit | 8,849m | Death Zone |
-            
-            *Note: Sleeping elevations are typically lower than summit elevations*
-            """)
+            st.markdown(load_markdown("destinations"))
     
     else:
         # Welcome screen
@@ -837,23 +1023,7 @@ def main():
     
     # Footer
     st.markdown("---")
-    st.markdown("""
-    <div style='text-align: center; color: #666; padding: 2rem 1rem 1rem 1rem;'>
-        <p style='font-size: 1.1em; margin-bottom: 1rem;'>
-            <strong>⚠️ EMERGENCY PROTOCOL:</strong> If experiencing severe symptoms, 
-            <strong style='color: #ff0000;'>DESCEND IMMEDIATELY</strong> and seek medical attention.
-        </p>
-        <p style='margin-bottom: 0.5rem;'>
-            <strong>Evidence Base:</strong> Wilderness Medical Society 2024 Clinical Practice Guidelines
-        </p>
-        <p style='font-size: 0.9em; color: #999;'>
-            This tool is for educational purposes only and does not replace professional medical advice.
-        </p>
-        <p style='font-size: 0.9em; color: #999; margin-top: 1rem;'>
-            Data sources: OpenStreetMap Nominatim API | Open-Elevation API
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()